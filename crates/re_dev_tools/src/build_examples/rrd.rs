@@ -92,6 +92,9 @@ impl Example {
         cmd.env("RERUN_FLUSH_TICK_SECS", 1_000_000_000.to_string());
         cmd.env("RERUN_FLUSH_NUM_BYTES", (128 * 1024).to_string());
 
+        // Let the SDK know it is being run as one of our official examples.
+        cmd.env("RERUN_DETECT_EXAMPLE_PATH", "1");
+
         let output = wait_for_output(cmd, &self.name, progress)?;
 
         if output.status.success() {
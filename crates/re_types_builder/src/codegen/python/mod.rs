@@ -562,21 +562,14 @@ fn code_for_struct(
             let (default_converter, converter_function) =
                 quote_field_converter_from_field(obj, objects, field);
 
-            let converter_override_name = format!("{}{FIELD_CONVERTER_SUFFIX}", field.name);
-
-            let converter = if ext_class
-                .field_converter_overrides
-                .contains(&converter_override_name)
+            let converter = if let Some(converter_override) =
+                quote_field_converter_override(ext_class, field)
             {
-                format!("converter={}.{converter_override_name}", ext_class.name)
+                format!("converter={converter_override}")
             } else if *kind == ObjectKind::Archetype {
                 // Archetypes use the ComponentBatch constructor for their fields
-                let (typ_unwrapped, _) = quote_field_type_from_field(objects, field, true);
-                if field.is_nullable {
-                    format!("converter={typ_unwrapped}Batch._optional, # type: ignore[misc]\n")
-                } else {
-                    format!("converter={typ_unwrapped}Batch._required, # type: ignore[misc]\n")
-                }
+                let converter = quote_archetype_field_converter(ext_class, objects, field);
+                format!("converter={converter}, # type: ignore[misc]\n")
             } else if !default_converter.is_empty() {
                 code.push_indented(0, &converter_function, 1);
                 format!("converter={default_converter}")
@@ -670,7 +663,7 @@ fn code_for_struct(
     }
 
     if obj.kind == ObjectKind::Archetype {
-        code.push_indented(1, quote_clear_methods(obj), 2);
+        code.push_indented(1, quote_clear_methods(obj, ext_class, objects), 2);
     }
 
     if obj.is_delegating_component() {
@@ -2147,6 +2140,20 @@ fn quote_init_method(
 
     let forwarding_call = if obj.is_union() {
         "self.inner = inner".to_owned()
+    } else if obj.kind == ObjectKind::Archetype {
+        // Archetypes convert and store their fields directly, rather than paying for an extra
+        // call through `__attrs_init__`.
+        obj.fields
+            .iter()
+            .map(|field| {
+                format!(
+                    r#"object.__setattr__(self, "{0}", {1}({0}))"#,
+                    field.name,
+                    quote_archetype_field_converter(ext_class, objects, field)
+                )
+            })
+            // Indented to match the `with catch_and_log_exceptions` block below.
+            .join("\n                ")
     } else {
         let attribute_init = obj
             .fields
@@ -2159,9 +2166,10 @@ fn quote_init_method(
 
     // Make sure Archetypes catch and log exceptions as a fallback
     let forwarding_call = if obj.kind == ObjectKind::Archetype {
+        let classname = &obj.name;
         unindent(&format!(
             r#"
-            with catch_and_log_exceptions(context=self.__class__.__name__):
+            with catch_and_log_exceptions(context="{classname}"):
                 {forwarding_call}
                 return
             self.__attrs_clear__()
@@ -2180,22 +2188,73 @@ fn quote_init_method(
     )
 }
 
-fn quote_clear_methods(obj: &Object) -> String {
-    let param_nones = obj
+/// Returns the extension class' converter override for the given field, if it has one.
+fn quote_field_converter_override(
+    ext_class: &ExtensionClass,
+    field: &ObjectField,
+) -> Option<String> {
+    let converter_override_name = format!("{}{FIELD_CONVERTER_SUFFIX}", field.name);
+    ext_class
+        .field_converter_overrides
+        .contains(&converter_override_name)
+        .then(|| format!("{}.{converter_override_name}", ext_class.name))
+}
+
+/// Returns the converter of the given archetype field: its converter override if there is one,
+/// otherwise the constructor of its component batch.
+///
+/// This is used both for the attrs `converter` and for the direct conversions performed by the
+/// generated `__init__` and `__attrs_clear__`.
+fn quote_archetype_field_converter(
+    ext_class: &ExtensionClass,
+    objects: &Objects,
+    field: &ObjectField,
+) -> String {
+    quote_field_converter_override(ext_class, field).unwrap_or_else(|| {
+        let (typ_unwrapped, _) = quote_field_type_from_field(objects, field, true);
+        if field.is_nullable {
+            format!("{typ_unwrapped}Batch._optional")
+        } else {
+            format!("{typ_unwrapped}Batch._required")
+        }
+    })
+}
+
+fn quote_clear_methods(obj: &Object, ext_class: &ExtensionClass, objects: &Objects) -> String {
+    // Write the cleared values directly rather than going through `__attrs_init__`: optional
+    // fields are cleared to `None` without a round-trip through their converter.
+    // Required fields still need their converter, which turns `None` into an empty batch.
+    let field_clears = obj
         .fields
         .iter()
-        .map(|field| format!("{} = None, # type: ignore[arg-type]", field.name))
-        .join("\n                ");
+        .map(|field| {
+            let cleared_value = if let Some(converter_override) =
+                quote_field_converter_override(ext_class, field)
+            {
+                // Converter overrides aren't typed to accept `None`.
+                format!("{converter_override}(None)  # type: ignore[arg-type]")
+            } else if field.is_nullable {
+                "None".to_owned()
+            } else {
+                format!(
+                    "{}(None)",
+                    quote_archetype_field_converter(ext_class, objects, field)
+                )
+            };
+            format!(
+                r#"object.__setattr__(self, "{}", {cleared_value})"#,
+                field.name
+            )
+        })
+        .join("\n            ");
 
     let classname = &obj.name;
 
     unindent(&format!(
         r#"
         def __attrs_clear__(self) -> None:
-            """Convenience method for calling `__attrs_init__` with all `None`s."""
-            self.__attrs_init__(
-                {param_nones}
-            )
+            """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+            {field_clears}
 
         @classmethod
         def _clear(cls) -> {classname}:
@@ -72,16 +72,14 @@ class AnnotationContext(Archetype):
         """
 
         # You can define your own __init__ function as a member of AnnotationContextExt in annotation_context_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(context=context)
+        with catch_and_log_exceptions(context="AnnotationContext"):
+            object.__setattr__(self, "context", components.AnnotationContextBatch._required(context))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            context=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "context", components.AnnotationContextBatch._required(None))
 
     @classmethod
     def _clear(cls) -> AnnotationContext:
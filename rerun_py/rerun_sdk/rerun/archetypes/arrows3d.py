@@ -53,15 +53,13 @@ class Arrows3D(Arrows3DExt, Archetype):
     # __init__ can be found in arrows3d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            vectors=None,  # type: ignore[arg-type]
-            origins=None,  # type: ignore[arg-type]
-            radii=None,  # type: ignore[arg-type]
-            colors=None,  # type: ignore[arg-type]
-            labels=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "vectors", components.Vector3DBatch._required(None))
+        object.__setattr__(self, "origins", None)
+        object.__setattr__(self, "radii", None)
+        object.__setattr__(self, "colors", None)
+        object.__setattr__(self, "labels", None)
+        object.__setattr__(self, "class_ids", None)
 
     @classmethod
     def _clear(cls) -> Arrows3D:
@@ -53,12 +53,10 @@ class Asset3D(Asset3DExt, Archetype):
     # __init__ can be found in asset3d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            blob=None,  # type: ignore[arg-type]
-            media_type=None,  # type: ignore[arg-type]
-            transform=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "blob", components.BlobBatch._required(None))
+        object.__setattr__(self, "media_type", None)
+        object.__setattr__(self, "transform", None)
 
     @classmethod
     def _clear(cls) -> Asset3D:
@@ -59,17 +59,16 @@ class BarChart(BarChartExt, Archetype):
         """
 
         # You can define your own __init__ function as a member of BarChartExt in bar_chart_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(values=values, color=color)
+        with catch_and_log_exceptions(context="BarChart"):
+            object.__setattr__(self, "values", BarChartExt.values__field_converter_override(values))
+            object.__setattr__(self, "color", components.ColorBatch._optional(color))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            values=None,  # type: ignore[arg-type]
-            color=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "values", BarChartExt.values__field_converter_override(None))  # type: ignore[arg-type]
+        object.__setattr__(self, "color", None)
 
     @classmethod
     def _clear(cls) -> BarChart:
@@ -44,16 +44,14 @@ class Boxes2D(Boxes2DExt, Archetype):
     # __init__ can be found in boxes2d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            half_sizes=None,  # type: ignore[arg-type]
-            centers=None,  # type: ignore[arg-type]
-            colors=None,  # type: ignore[arg-type]
-            radii=None,  # type: ignore[arg-type]
-            labels=None,  # type: ignore[arg-type]
-            draw_order=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "half_sizes", components.HalfSizes2DBatch._required(None))
+        object.__setattr__(self, "centers", None)
+        object.__setattr__(self, "colors", None)
+        object.__setattr__(self, "radii", None)
+        object.__setattr__(self, "labels", None)
+        object.__setattr__(self, "draw_order", None)
+        object.__setattr__(self, "class_ids", None)
 
     @classmethod
     def _clear(cls) -> Boxes2D:
@@ -59,16 +59,14 @@ class Boxes3D(Boxes3DExt, Archetype):
     # __init__ can be found in boxes3d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            half_sizes=None,  # type: ignore[arg-type]
-            centers=None,  # type: ignore[arg-type]
-            rotations=None,  # type: ignore[arg-type]
-            colors=None,  # type: ignore[arg-type]
-            radii=None,  # type: ignore[arg-type]
-            labels=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "half_sizes", components.HalfSizes3DBatch._required(None))
+        object.__setattr__(self, "centers", None)
+        object.__setattr__(self, "rotations", None)
+        object.__setattr__(self, "colors", None)
+        object.__setattr__(self, "radii", None)
+        object.__setattr__(self, "labels", None)
+        object.__setattr__(self, "class_ids", None)
 
     @classmethod
     def _clear(cls) -> Boxes3D:
@@ -64,10 +64,8 @@ class Clear(ClearExt, Archetype):
     # __init__ can be found in clear_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            is_recursive=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "is_recursive", components.ClearIsRecursiveBatch._required(None))
 
     @classmethod
     def _clear(cls) -> Clear:
@@ -55,10 +55,8 @@ class DisconnectedSpace(DisconnectedSpaceExt, Archetype):
     # __init__ can be found in disconnected_space_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            disconnected_space=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "disconnected_space", components.DisconnectedSpaceBatch._required(None))
 
     @classmethod
     def _clear(cls) -> DisconnectedSpace:
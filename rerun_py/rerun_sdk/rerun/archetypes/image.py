@@ -83,17 +83,16 @@ class Image(ImageExt, Archetype):
         """
 
         # You can define your own __init__ function as a member of ImageExt in image_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(data=data, draw_order=draw_order)
+        with catch_and_log_exceptions(context="Image"):
+            object.__setattr__(self, "data", ImageExt.data__field_converter_override(data))
+            object.__setattr__(self, "draw_order", components.DrawOrderBatch._optional(draw_order))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            data=None,  # type: ignore[arg-type]
-            draw_order=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "data", ImageExt.data__field_converter_override(None))  # type: ignore[arg-type]
+        object.__setattr__(self, "draw_order", None)
 
     @classmethod
     def _clear(cls) -> Image:
@@ -98,20 +98,22 @@ class LineStrips3D(Archetype):
         """
 
         # You can define your own __init__ function as a member of LineStrips3DExt in line_strips3d_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(strips=strips, radii=radii, colors=colors, labels=labels, class_ids=class_ids)
+        with catch_and_log_exceptions(context="LineStrips3D"):
+            object.__setattr__(self, "strips", components.LineStrip3DBatch._required(strips))
+            object.__setattr__(self, "radii", components.RadiusBatch._optional(radii))
+            object.__setattr__(self, "colors", components.ColorBatch._optional(colors))
+            object.__setattr__(self, "labels", components.TextBatch._optional(labels))
+            object.__setattr__(self, "class_ids", components.ClassIdBatch._optional(class_ids))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            strips=None,  # type: ignore[arg-type]
-            radii=None,  # type: ignore[arg-type]
-            colors=None,  # type: ignore[arg-type]
-            labels=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "strips", components.LineStrip3DBatch._required(None))
+        object.__setattr__(self, "radii", None)
+        object.__setattr__(self, "colors", None)
+        object.__setattr__(self, "labels", None)
+        object.__setattr__(self, "class_ids", None)
 
     @classmethod
     def _clear(cls) -> LineStrips3D:
@@ -54,17 +54,15 @@ class Mesh3D(Mesh3DExt, Archetype):
     # __init__ can be found in mesh3d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            vertex_positions=None,  # type: ignore[arg-type]
-            triangle_indices=None,  # type: ignore[arg-type]
-            vertex_normals=None,  # type: ignore[arg-type]
-            vertex_colors=None,  # type: ignore[arg-type]
-            vertex_texcoords=None,  # type: ignore[arg-type]
-            mesh_material=None,  # type: ignore[arg-type]
-            albedo_texture=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "vertex_positions", components.Position3DBatch._required(None))
+        object.__setattr__(self, "triangle_indices", None)
+        object.__setattr__(self, "vertex_normals", None)
+        object.__setattr__(self, "vertex_colors", None)
+        object.__setattr__(self, "vertex_texcoords", None)
+        object.__setattr__(self, "mesh_material", None)
+        object.__setattr__(self, "albedo_texture", None)
+        object.__setattr__(self, "class_ids", None)
 
     @classmethod
     def _clear(cls) -> Mesh3D:
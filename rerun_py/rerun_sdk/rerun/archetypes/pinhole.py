@@ -68,12 +68,10 @@ class Pinhole(PinholeExt, Archetype):
     # __init__ can be found in pinhole_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            image_from_camera=None,  # type: ignore[arg-type]
-            resolution=None,  # type: ignore[arg-type]
-            camera_xyz=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "image_from_camera", components.PinholeProjectionBatch._required(None))
+        object.__setattr__(self, "resolution", None)
+        object.__setattr__(self, "camera_xyz", None)
 
     @classmethod
     def _clear(cls) -> Pinhole:
@@ -54,16 +54,14 @@ class Points2D(Points2DExt, Archetype):
     # __init__ can be found in points2d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            positions=None,  # type: ignore[arg-type]
-            radii=None,  # type: ignore[arg-type]
-            colors=None,  # type: ignore[arg-type]
-            labels=None,  # type: ignore[arg-type]
-            draw_order=None,  # type: ignore[arg-type]
-            class_ids=None,  # type: ignore[arg-type]
-            keypoint_ids=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "positions", components.Position2DBatch._required(None))
+        object.__setattr__(self, "radii", None)
+        object.__setattr__(self, "colors", None)
+        object.__setattr__(self, "labels", None)
+        object.__setattr__(self, "draw_order", None)
+        object.__setattr__(self, "class_ids", None)
+        object.__setattr__(self, "keypoint_ids", None)
 
     @classmethod
     def _clear(cls) -> Points2D:
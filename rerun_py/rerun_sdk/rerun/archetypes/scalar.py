@@ -70,16 +70,14 @@ class Scalar(Archetype):
         """
 
         # You can define your own __init__ function as a member of ScalarExt in scalar_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(scalar=scalar)
+        with catch_and_log_exceptions(context="Scalar"):
+            object.__setattr__(self, "scalar", components.ScalarBatch._required(scalar))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            scalar=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "scalar", components.ScalarBatch._required(None))
 
     @classmethod
     def _clear(cls) -> Scalar:
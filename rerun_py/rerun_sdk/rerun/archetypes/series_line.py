@@ -86,18 +86,18 @@ class SeriesLine(Archetype):
         """
 
         # You can define your own __init__ function as a member of SeriesLineExt in series_line_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(color=color, width=width, name=name)
+        with catch_and_log_exceptions(context="SeriesLine"):
+            object.__setattr__(self, "color", components.ColorBatch._optional(color))
+            object.__setattr__(self, "width", components.StrokeWidthBatch._optional(width))
+            object.__setattr__(self, "name", components.NameBatch._optional(name))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            color=None,  # type: ignore[arg-type]
-            width=None,  # type: ignore[arg-type]
-            name=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "color", None)
+        object.__setattr__(self, "width", None)
+        object.__setattr__(self, "name", None)
 
     @classmethod
     def _clear(cls) -> SeriesLine:
@@ -107,19 +107,20 @@ class SeriesPoint(Archetype):
         """
 
         # You can define your own __init__ function as a member of SeriesPointExt in series_point_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(color=color, marker=marker, name=name, marker_size=marker_size)
+        with catch_and_log_exceptions(context="SeriesPoint"):
+            object.__setattr__(self, "color", components.ColorBatch._optional(color))
+            object.__setattr__(self, "marker", components.MarkerShapeBatch._optional(marker))
+            object.__setattr__(self, "name", components.NameBatch._optional(name))
+            object.__setattr__(self, "marker_size", components.MarkerSizeBatch._optional(marker_size))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            color=None,  # type: ignore[arg-type]
-            marker=None,  # type: ignore[arg-type]
-            name=None,  # type: ignore[arg-type]
-            marker_size=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "color", None)
+        object.__setattr__(self, "marker", None)
+        object.__setattr__(self, "name", None)
+        object.__setattr__(self, "marker_size", None)
 
     @classmethod
     def _clear(cls) -> SeriesPoint:
@@ -48,10 +48,8 @@ class Tensor(TensorExt, Archetype):
     # __init__ can be found in tensor_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            data=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "data", components.TensorDataBatch._required(None))
 
     @classmethod
     def _clear(cls) -> Tensor:
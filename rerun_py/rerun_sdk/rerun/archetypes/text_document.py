@@ -107,17 +107,16 @@ class TextDocument(Archetype):
         """
 
         # You can define your own __init__ function as a member of TextDocumentExt in text_document_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(text=text, media_type=media_type)
+        with catch_and_log_exceptions(context="TextDocument"):
+            object.__setattr__(self, "text", components.TextBatch._required(text))
+            object.__setattr__(self, "media_type", components.MediaTypeBatch._optional(media_type))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            text=None,  # type: ignore[arg-type]
-            media_type=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "text", components.TextBatch._required(None))
+        object.__setattr__(self, "media_type", None)
 
     @classmethod
     def _clear(cls) -> TextDocument:
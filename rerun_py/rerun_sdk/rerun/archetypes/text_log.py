@@ -75,18 +75,18 @@ class TextLog(Archetype):
         """
 
         # You can define your own __init__ function as a member of TextLogExt in text_log_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(text=text, level=level, color=color)
+        with catch_and_log_exceptions(context="TextLog"):
+            object.__setattr__(self, "text", components.TextBatch._required(text))
+            object.__setattr__(self, "level", components.TextLogLevelBatch._optional(level))
+            object.__setattr__(self, "color", components.ColorBatch._optional(color))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            text=None,  # type: ignore[arg-type]
-            level=None,  # type: ignore[arg-type]
-            color=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "text", components.TextBatch._required(None))
+        object.__setattr__(self, "level", None)
+        object.__setattr__(self, "color", None)
 
     @classmethod
     def _clear(cls) -> TextLog:
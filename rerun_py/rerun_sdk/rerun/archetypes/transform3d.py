@@ -61,10 +61,8 @@ class Transform3D(Transform3DExt, Archetype):
     # __init__ can be found in transform3d_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            transform=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "transform", components.Transform3DBatch._required(None))
 
     @classmethod
     def _clear(cls) -> Transform3D:
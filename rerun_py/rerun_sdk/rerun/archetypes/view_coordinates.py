@@ -70,16 +70,14 @@ class ViewCoordinates(ViewCoordinatesExt, Archetype):
         """
 
         # You can define your own __init__ function as a member of ViewCoordinatesExt in view_coordinates_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(xyz=xyz)
+        with catch_and_log_exceptions(context="ViewCoordinates"):
+            object.__setattr__(self, "xyz", components.ViewCoordinatesBatch._required(xyz))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            xyz=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "xyz", components.ViewCoordinatesBatch._required(None))
 
     @classmethod
     def _clear(cls) -> ViewCoordinates:
@@ -22,11 +22,9 @@ class Background(BackgroundExt, Archetype):
     # __init__ can be found in background_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            kind=None,  # type: ignore[arg-type]
-            color=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "kind", blueprint_components.BackgroundKindBatch._required(None))
+        object.__setattr__(self, "color", None)
 
     @classmethod
     def _clear(cls) -> Background:
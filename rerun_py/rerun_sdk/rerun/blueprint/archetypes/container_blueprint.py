@@ -74,32 +74,30 @@ class ContainerBlueprint(Archetype):
         """
 
         # You can define your own __init__ function as a member of ContainerBlueprintExt in container_blueprint_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                container_kind=container_kind,
-                display_name=display_name,
-                contents=contents,
-                col_shares=col_shares,
-                row_shares=row_shares,
-                active_tab=active_tab,
-                visible=visible,
-                grid_columns=grid_columns,
+        with catch_and_log_exceptions(context="ContainerBlueprint"):
+            object.__setattr__(
+                self, "container_kind", blueprint_components.ContainerKindBatch._required(container_kind)
             )
+            object.__setattr__(self, "display_name", components.NameBatch._optional(display_name))
+            object.__setattr__(self, "contents", blueprint_components.IncludedContentBatch._optional(contents))
+            object.__setattr__(self, "col_shares", blueprint_components.ColumnShareBatch._optional(col_shares))
+            object.__setattr__(self, "row_shares", blueprint_components.RowShareBatch._optional(row_shares))
+            object.__setattr__(self, "active_tab", blueprint_components.ActiveTabBatch._optional(active_tab))
+            object.__setattr__(self, "visible", blueprint_components.VisibleBatch._optional(visible))
+            object.__setattr__(self, "grid_columns", blueprint_components.GridColumnsBatch._optional(grid_columns))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            container_kind=None,  # type: ignore[arg-type]
-            display_name=None,  # type: ignore[arg-type]
-            contents=None,  # type: ignore[arg-type]
-            col_shares=None,  # type: ignore[arg-type]
-            row_shares=None,  # type: ignore[arg-type]
-            active_tab=None,  # type: ignore[arg-type]
-            visible=None,  # type: ignore[arg-type]
-            grid_columns=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "container_kind", blueprint_components.ContainerKindBatch._required(None))
+        object.__setattr__(self, "display_name", None)
+        object.__setattr__(self, "contents", None)
+        object.__setattr__(self, "col_shares", None)
+        object.__setattr__(self, "row_shares", None)
+        object.__setattr__(self, "active_tab", None)
+        object.__setattr__(self, "visible", None)
+        object.__setattr__(self, "grid_columns", None)
 
     @classmethod
     def _clear(cls) -> ContainerBlueprint:
@@ -33,16 +33,14 @@ class PanelBlueprint(Archetype):
         """
 
         # You can define your own __init__ function as a member of PanelBlueprintExt in panel_blueprint_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(expanded=expanded)
+        with catch_and_log_exceptions(context="PanelBlueprint"):
+            object.__setattr__(self, "expanded", blueprint_components.PanelExpandedBatch._optional(expanded))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            expanded=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "expanded", None)
 
     @classmethod
     def _clear(cls) -> PanelBlueprint:
@@ -21,11 +21,9 @@ class PlotLegend(PlotLegendExt, Archetype):
     # __init__ can be found in plot_legend_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            corner=None,  # type: ignore[arg-type]
-            visible=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "corner", None)
+        object.__setattr__(self, "visible", None)
 
     @classmethod
     def _clear(cls) -> PlotLegend:
@@ -42,17 +42,20 @@ class ScalarAxis(Archetype):
         """
 
         # You can define your own __init__ function as a member of ScalarAxisExt in scalar_axis_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(range=range, lock_range_during_zoom=lock_range_during_zoom)
+        with catch_and_log_exceptions(context="ScalarAxis"):
+            object.__setattr__(self, "range", components.Range1DBatch._optional(range))
+            object.__setattr__(
+                self,
+                "lock_range_during_zoom",
+                blueprint_components.LockRangeDuringZoomBatch._optional(lock_range_during_zoom),
+            )
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            range=None,  # type: ignore[arg-type]
-            lock_range_during_zoom=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "range", None)
+        object.__setattr__(self, "lock_range_during_zoom", None)
 
     @classmethod
     def _clear(cls) -> ScalarAxis:
@@ -54,21 +54,22 @@ class SpaceViewBlueprint(Archetype):
         """
 
         # You can define your own __init__ function as a member of SpaceViewBlueprintExt in space_view_blueprint_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                class_identifier=class_identifier, display_name=display_name, space_origin=space_origin, visible=visible
+        with catch_and_log_exceptions(context="SpaceViewBlueprint"):
+            object.__setattr__(
+                self, "class_identifier", blueprint_components.SpaceViewClassBatch._required(class_identifier)
             )
+            object.__setattr__(self, "display_name", components.NameBatch._optional(display_name))
+            object.__setattr__(self, "space_origin", blueprint_components.SpaceViewOriginBatch._optional(space_origin))
+            object.__setattr__(self, "visible", blueprint_components.VisibleBatch._optional(visible))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            class_identifier=None,  # type: ignore[arg-type]
-            display_name=None,  # type: ignore[arg-type]
-            space_origin=None,  # type: ignore[arg-type]
-            visible=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "class_identifier", blueprint_components.SpaceViewClassBatch._required(None))
+        object.__setattr__(self, "display_name", None)
+        object.__setattr__(self, "space_origin", None)
+        object.__setattr__(self, "visible", None)
 
     @classmethod
     def _clear(cls) -> SpaceViewBlueprint:
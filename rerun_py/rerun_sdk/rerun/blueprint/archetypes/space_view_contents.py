@@ -74,16 +74,14 @@ class SpaceViewContents(Archetype):
         """
 
         # You can define your own __init__ function as a member of SpaceViewContentsExt in space_view_contents_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(query=query)
+        with catch_and_log_exceptions(context="SpaceViewContents"):
+            object.__setattr__(self, "query", blueprint_components.QueryExpressionBatch._required(query))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            query=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "query", blueprint_components.QueryExpressionBatch._required(None))
 
     @classmethod
     def _clear(cls) -> SpaceViewContents:
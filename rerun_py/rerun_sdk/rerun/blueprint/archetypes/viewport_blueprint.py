@@ -61,26 +61,30 @@ class ViewportBlueprint(Archetype):
         """
 
         # You can define your own __init__ function as a member of ViewportBlueprintExt in viewport_blueprint_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                root_container=root_container,
-                maximized=maximized,
-                auto_layout=auto_layout,
-                auto_space_views=auto_space_views,
-                past_viewer_recommendations=past_viewer_recommendations,
+        with catch_and_log_exceptions(context="ViewportBlueprint"):
+            object.__setattr__(
+                self, "root_container", blueprint_components.RootContainerBatch._optional(root_container)
+            )
+            object.__setattr__(self, "maximized", blueprint_components.SpaceViewMaximizedBatch._optional(maximized))
+            object.__setattr__(self, "auto_layout", blueprint_components.AutoLayoutBatch._optional(auto_layout))
+            object.__setattr__(
+                self, "auto_space_views", blueprint_components.AutoSpaceViewsBatch._optional(auto_space_views)
+            )
+            object.__setattr__(
+                self,
+                "past_viewer_recommendations",
+                blueprint_components.ViewerRecommendationHashBatch._optional(past_viewer_recommendations),
             )
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            root_container=None,  # type: ignore[arg-type]
-            maximized=None,  # type: ignore[arg-type]
-            auto_layout=None,  # type: ignore[arg-type]
-            auto_space_views=None,  # type: ignore[arg-type]
-            past_viewer_recommendations=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "root_container", None)
+        object.__setattr__(self, "maximized", None)
+        object.__setattr__(self, "auto_layout", None)
+        object.__setattr__(self, "auto_space_views", None)
+        object.__setattr__(self, "past_viewer_recommendations", None)
 
     @classmethod
     def _clear(cls) -> ViewportBlueprint:
@@ -45,16 +45,14 @@ class VisibleTimeRanges(Archetype):
         """
 
         # You can define your own __init__ function as a member of VisibleTimeRangesExt in visible_time_ranges_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(ranges=ranges)
+        with catch_and_log_exceptions(context="VisibleTimeRanges"):
+            object.__setattr__(self, "ranges", blueprint_components.VisibleTimeRangeBatch._required(ranges))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            ranges=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "ranges", blueprint_components.VisibleTimeRangeBatch._required(None))
 
     @classmethod
     def _clear(cls) -> VisibleTimeRanges:
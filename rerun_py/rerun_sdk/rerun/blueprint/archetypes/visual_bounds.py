@@ -21,10 +21,8 @@ class VisualBounds(VisualBoundsExt, Archetype):
     # __init__ can be found in visual_bounds_ext.py
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            range2d=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "range2d", None)
 
     @classmethod
     def _clear(cls) -> VisualBounds:
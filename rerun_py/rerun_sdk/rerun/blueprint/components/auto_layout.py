@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 from attrs import define, field
 
@@ -37,10 +38,7 @@ if TYPE_CHECKING:
 else:
     AutoLayoutLike = Any
 
-AutoLayoutArrayLike = Union[
-    AutoLayout,
-    Sequence[AutoLayoutLike],
-]
+AutoLayoutArrayLike = Union[AutoLayout, Sequence[AutoLayoutLike], bool, npt.NDArray[np.bool_]]
 
 
 class AutoLayoutType(BaseExtensionType):
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 from attrs import define, field
 
@@ -43,10 +44,7 @@ if TYPE_CHECKING:
 else:
     AutoSpaceViewsLike = Any
 
-AutoSpaceViewsArrayLike = Union[
-    AutoSpaceViews,
-    Sequence[AutoSpaceViewsLike],
-]
+AutoSpaceViewsArrayLike = Union[AutoSpaceViews, Sequence[AutoSpaceViewsLike], bool, npt.NDArray[np.bool_]]
 
 
 class AutoSpaceViewsType(BaseExtensionType):
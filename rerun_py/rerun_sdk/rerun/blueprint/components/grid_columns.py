@@ -53,10 +53,7 @@ if TYPE_CHECKING:
 else:
     GridColumnsLike = Any
 
-GridColumnsArrayLike = Union[
-    GridColumns,
-    Sequence[GridColumnsLike],
-]
+GridColumnsArrayLike = Union[GridColumns, Sequence[GridColumnsLike], int, npt.NDArray[np.uint32]]
 
 
 class GridColumnsType(BaseExtensionType):
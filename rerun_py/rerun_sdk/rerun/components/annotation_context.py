@@ -67,6 +67,8 @@ else:
 AnnotationContextArrayLike = Union[
     AnnotationContext,
     Sequence[AnnotationContextLike],
+    datatypes.ClassDescriptionArrayLike,
+    Sequence[datatypes.ClassDescriptionMapElemLike],
 ]
 
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 from attrs import define, field
 
@@ -37,10 +38,7 @@ if TYPE_CHECKING:
 else:
     BoolLike = Any
 
-BoolArrayLike = Union[
-    Bool,
-    Sequence[BoolLike],
-]
+BoolArrayLike = Union[Bool, Sequence[BoolLike], bool, npt.NDArray[np.bool_]]
 
 
 class BoolType(BaseExtensionType):
@@ -44,7 +44,7 @@ else:
     Range1DLike = Any
 
 Range1DArrayLike = Union[
-    Range1D, Sequence[Range1DLike], npt.NDArray[Any], npt.ArrayLike, Sequence[Sequence[float]], Sequence[float]
+    Range1D, Sequence[Range1DLike], npt.NDArray[Any], npt.ArrayLike, Sequence[Sequence[float]], Sequence[float], slice
 ]
 
 
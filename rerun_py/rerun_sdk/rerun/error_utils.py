@@ -31,7 +31,23 @@ def default_strict_mode() -> bool:
 # If `False` we catch all errors and log a warning instead.
 _strict_mode = default_strict_mode()
 
-_rerun_exception_ctx = threading.local()
+
+class _RerunExceptionCtx(threading.local):
+    """
+    Thread-local state shared by all `catch_and_log_exceptions` scopes.
+
+    All attributes are initialized up-front (once per thread), so that the context managers can
+    access them directly rather than going through `getattr` with a default on every enter/exit.
+    """
+
+    def __init__(self) -> None:
+        self.strict_mode: bool | None = None
+        self.depth = 0
+        self.pending_warnings: list[str] = []
+        self.sending_warning = False
+
+
+_rerun_exception_ctx = _RerunExceptionCtx()
 
 
 def strict_mode() -> bool:
@@ -46,8 +62,8 @@ def strict_mode() -> bool:
     or `False` if it is not set.
     """
     # If strict was set explicitly, we are in struct mode
-    if getattr(_rerun_exception_ctx, "strict_mode", None) is not None:
-        return _rerun_exception_ctx.strict_mode  # type: ignore[no-any-return]
+    if _rerun_exception_ctx.strict_mode is not None:
+        return _rerun_exception_ctx.strict_mode
     else:
         return _strict_mode
 
@@ -111,7 +127,7 @@ def _send_warning_or_raise(
     warnings.warn(message, category=RerunWarning, stacklevel=depth_to_user_code + 1)
 
     # Logging the warning to Rerun is a complex operation could produce another warning. Avoid recursion.
-    if not getattr(_rerun_exception_ctx, "sending_warning", False):
+    if not _rerun_exception_ctx.sending_warning:
         _rerun_exception_ctx.sending_warning = True
 
         # TODO(jleibs): Context/stack should be its own component.
@@ -169,13 +185,10 @@ class catch_and_log_exceptions:
     def __enter__(self) -> catch_and_log_exceptions:
         # Track the original strict_mode setting in case it's being
         # overridden locally in this stack
-        self.original_strict = getattr(_rerun_exception_ctx, "strict_mode", None)
+        self.original_strict = _rerun_exception_ctx.strict_mode
         if self.strict is not None:
             _rerun_exception_ctx.strict_mode = self.strict
-        if getattr(_rerun_exception_ctx, "depth", None) is None:
-            _rerun_exception_ctx.depth = 1
-        else:
-            _rerun_exception_ctx.depth += 1
+        _rerun_exception_ctx.depth += 1
 
         return self
 
@@ -205,9 +218,6 @@ class catch_and_log_exceptions:
             # Exceptions inheriting from `BaseException` others than via `Exception` are "exiting", and should be pass
             # through. This includes `KeyboardInterrupt` and `SystemExit`.
             if exc_type is not None and issubclass(exc_type, Exception) and not strict_mode():
-                if getattr(_rerun_exception_ctx, "pending_warnings", None) is None:
-                    _rerun_exception_ctx.pending_warnings = []
-
                 context = f"{self.context}: " if self.context is not None else ""
 
                 warning_message = f"{context}{exc_type.__name__}({exc_val})"
@@ -217,12 +227,11 @@ class catch_and_log_exceptions:
             else:
                 return False
         finally:
-            if getattr(_rerun_exception_ctx, "depth", None) is not None:
+            if _rerun_exception_ctx.depth > 0:
                 _rerun_exception_ctx.depth -= 1
                 if _rerun_exception_ctx.depth == 0:
-                    pending_warnings = getattr(_rerun_exception_ctx, "pending_warnings", [])
+                    pending_warnings = _rerun_exception_ctx.pending_warnings
                     _rerun_exception_ctx.pending_warnings = []
-                    _rerun_exception_ctx.depth = None
 
                     for warning in pending_warnings:
                         _send_warning_or_raise(warning, depth_to_user_code=self.depth_to_user_code + 2)
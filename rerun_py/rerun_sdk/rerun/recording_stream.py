@@ -2,11 +2,35 @@ from __future__ import annotations
 
 import functools
 import inspect
+import os
+import sys
 import uuid
+from types import FrameType
 from typing import Any, Callable, TypeVar
 
 from rerun import bindings
 
+# Pre-resolved bindings, so that the accessors below don't have to go through the module's dict on every call.
+_b_is_enabled = bindings.is_enabled
+_b_get_app_id = bindings.get_application_id
+_b_get_rec_id = bindings.get_recording_id
+_b_get_data = bindings.get_data_recording
+_b_get_global = bindings.get_global_data_recording
+_b_set_global = bindings.set_global_data_recording
+_b_get_tls = bindings.get_thread_local_data_recording
+_b_set_tls = bindings.set_thread_local_data_recording
+_b_flush = bindings.flush
+
+# Whether `new_recording` should look for an official Rerun example in the call stack.
+# This is only ever useful for our own examples, so it is opt-in: set `RERUN_DETECT_EXAMPLE_PATH=1`
+# when running them (`scripts/run_all.py`, `scripts/run_python_e2e_test.py` and `build_examples` do so).
+_DETECT_EXAMPLE_PATH = os.environ.get("RERUN_DETECT_EXAMPLE_PATH") == "1"
+
+
+# Whether a global or thread-local data recording might have been set by now (on any thread).
+# Until then, `get_data_recording` can answer without going through the bindings.
+_any_recording_set = False
+
 
 # ---
 # TODO(#3793): defaulting recording_id to authkey should be opt-in
@@ -93,30 +117,43 @@ def new_recording(
     # we lose most of the details of the python part of the backtrace once we go over the bridge.
     #
     # Still, better than nothing!
-    try:
-        import inspect
-        import pathlib
-
-        # We're trying to grab the filesystem path of the example script that called `init()`.
-        # The tricky part is that we don't know how many layers are between this script and the
-        # original caller, so we have to walk the stack and look for anything that might look like
-        # an official Rerun example.
-
-        MAX_FRAMES = 10  # try the first 10 frames, should be more than enough
-        FRAME_FILENAME_INDEX = 1  # `FrameInfo` tuple has `filename` at index 1
-
-        stack = inspect.stack()
-        for frame in stack[:MAX_FRAMES]:
-            filename = frame[FRAME_FILENAME_INDEX]
-            path = pathlib.Path(str(filename)).resolve()  # normalize before comparison!
-            if "rerun/examples" in str(path):
-                application_path = path
-    except Exception:
-        pass
-
-    if recording_id is not None:
+    if _DETECT_EXAMPLE_PATH:
+        try:
+            import pathlib
+
+            # We're trying to grab the filesystem path of the example script that called `init()`.
+            # The tricky part is that we don't know how many layers are between this script and the
+            # original caller, so we have to walk the stack and look for anything that might look like
+            # an official Rerun example.
+            #
+            # We walk the raw frames rather than using `inspect.stack()`, which would read the source
+            # of every single frame on the stack just to build its context lines.
+
+            MAX_FRAMES = 10  # try the first 10 frames, should be more than enough
+
+            frame: FrameType | None = sys._getframe(1)
+            for _ in range(MAX_FRAMES):
+                if frame is None:
+                    break
+                filename = frame.f_code.co_filename
+                # Cheap check on the raw filename first (with either path separator, for Windows):
+                # resolving hits the filesystem.
+                if "rerun/examples" in filename or "rerun\\examples" in filename:
+                    path = pathlib.Path(filename).resolve()  # normalize before comparison!
+                    if "rerun/examples" in path.as_posix():
+                        application_path = path
+                        break
+                frame = frame.f_back
+        except Exception:
+            pass
+
+    if recording_id is not None and not isinstance(recording_id, str):
         recording_id = str(recording_id)
 
+    global _any_recording_set
+    if make_default or make_thread_default:
+        _any_recording_set = True
+
     recording = RecordingStream(
         bindings.new_recording(
             application_id=application_id,
@@ -196,24 +233,37 @@ class RecordingStream:
 
     """
 
+    __slots__ = ("inner", "_prev")
+
+    inner: bindings.PyRecordingStream
+    _prev: bindings.PyRecordingStream | None
+
     def __init__(self, inner: bindings.PyRecordingStream) -> None:
         self.inner = inner
-        self._prev: RecordingStream | None = None
+        self._prev = None
 
+    # NOTE: We talk to the bindings directly here: wrapping the previous recording in a `RecordingStream`
+    # would only create a throwaway handle, whose `__del__` then triggers yet another flush.
     def __enter__(self):  # type: ignore[no-untyped-def]
-        self._prev = set_thread_local_data_recording(self)
+        global _any_recording_set
+        _any_recording_set = True
+
+        self._prev = _b_set_tls(recording=self.inner)
         return self
 
     def __exit__(self, type, value, traceback):  # type: ignore[no-untyped-def]
-        self._prev = set_thread_local_data_recording(self._prev)  # type: ignore[arg-type]
+        _b_set_tls(recording=self._prev)
+        self._prev = None
 
     # NOTE: The type is a string because we cannot reference `RecordingStream` yet at this point.
     def to_native(self: RecordingStream | None) -> bindings.PyRecordingStream | None:
         return self.inner if self is not None else None
 
     def __del__(self):  # type: ignore[no-untyped-def]
-        recording = RecordingStream.to_native(self)
-        bindings.flush(blocking=False, recording=recording)
+        _b_flush(blocking=False, recording=self.inner)
+
+
+_to_native = RecordingStream.to_native
 
 
 def _patch(funcs):  # type: ignore[no-untyped-def]
@@ -257,7 +307,7 @@ def is_enabled(
     This can be controlled with the environment variable `RERUN` (e.g. `RERUN=on` or `RERUN=off`).
 
     """
-    return bindings.is_enabled(recording=RecordingStream.to_native(recording))  # type: ignore[no-any-return]
+    return _b_is_enabled(recording=_to_native(recording))  # type: ignore[no-any-return]
 
 
 def get_application_id(
@@ -279,7 +329,7 @@ def get_application_id(
         The application ID that this recording is associated with.
 
     """
-    app_id = bindings.get_application_id(recording=RecordingStream.to_native(recording))
+    app_id = _b_get_app_id(recording=_to_native(recording))
     return str(app_id) if app_id is not None else None
 
 
@@ -311,7 +361,7 @@ def get_recording_id(
         The recording ID that this recording is logging to.
 
     """
-    rec_id = bindings.get_recording_id(recording=RecordingStream.to_native(recording))
+    rec_id = _b_get_rec_id(recording=_to_native(recording))
     return str(rec_id) if rec_id is not None else None
 
 
@@ -344,7 +394,13 @@ def get_data_recording(
         The most appropriate recording to log data to, in the current context, if any.
 
     """
-    result = bindings.get_data_recording(recording=recording)
+    if recording is not None:
+        return recording
+
+    if not _any_recording_set:
+        return None
+
+    result = _b_get_data(recording=None)
     return RecordingStream(result) if result is not None else None
 
 
@@ -358,7 +414,7 @@ def get_global_data_recording() -> RecordingStream | None:
         The currently active global recording, if any.
 
     """
-    result = bindings.get_global_data_recording()
+    result = _b_get_global()
     return RecordingStream(result) if result is not None else None
 
 
@@ -372,7 +428,10 @@ def set_global_data_recording(recording: RecordingStream) -> RecordingStream | N
         The newly active global recording.
 
     """
-    result = bindings.set_global_data_recording(RecordingStream.to_native(recording))
+    global _any_recording_set
+    _any_recording_set = True
+
+    result = _b_set_global(_to_native(recording))
     return RecordingStream(result) if result is not None else None
 
 
@@ -386,7 +445,7 @@ def get_thread_local_data_recording() -> RecordingStream | None:
         The currently active thread-local recording, if any.
 
     """
-    result = bindings.get_thread_local_data_recording()
+    result = _b_get_tls()
     return RecordingStream(result) if result is not None else None
 
 
@@ -400,7 +459,10 @@ def set_thread_local_data_recording(recording: RecordingStream) -> RecordingStre
         The newly active thread-local recording.
 
     """
-    result = bindings.set_thread_local_data_recording(recording=RecordingStream.to_native(recording))
+    global _any_recording_set
+    _any_recording_set = True
+
+    result = _b_set_tls(recording=_to_native(recording))
     return RecordingStream(result) if result is not None else None
 
 
@@ -444,11 +506,9 @@ def thread_local_stream(application_id: str) -> Callable[[_TFunc], _TFunc]:
                 gen = func(*args, **kwargs)
                 try:
                     with new_recording(application_id, recording_id=uuid.uuid4()):
-                        value = next(gen)  # Start the generator inside the context
-                        while True:
-                            value = gen.send((yield value))  # Continue the generator
-                except StopIteration:
-                    pass
+                        # Run the generator inside the context; `yield from` forwards `send()`/`throw()`
+                        # to it natively, and hands us back its return value.
+                        return (yield from gen)
                 finally:
                     gen.close()
 
@@ -46,60 +46,56 @@ class AffixFuzzer1(Archetype):
         """Create a new instance of the AffixFuzzer1 archetype."""
 
         # You can define your own __init__ function as a member of AffixFuzzer1Ext in affix_fuzzer1_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                fuzz1001=fuzz1001,
-                fuzz1002=fuzz1002,
-                fuzz1003=fuzz1003,
-                fuzz1004=fuzz1004,
-                fuzz1005=fuzz1005,
-                fuzz1006=fuzz1006,
-                fuzz1007=fuzz1007,
-                fuzz1008=fuzz1008,
-                fuzz1009=fuzz1009,
-                fuzz1010=fuzz1010,
-                fuzz1011=fuzz1011,
-                fuzz1012=fuzz1012,
-                fuzz1013=fuzz1013,
-                fuzz1014=fuzz1014,
-                fuzz1015=fuzz1015,
-                fuzz1016=fuzz1016,
-                fuzz1017=fuzz1017,
-                fuzz1018=fuzz1018,
-                fuzz1019=fuzz1019,
-                fuzz1020=fuzz1020,
-                fuzz1021=fuzz1021,
-                fuzz1022=fuzz1022,
-            )
+        with catch_and_log_exceptions(context="AffixFuzzer1"):
+            object.__setattr__(self, "fuzz1001", components.AffixFuzzer1Batch._required(fuzz1001))
+            object.__setattr__(self, "fuzz1002", components.AffixFuzzer2Batch._required(fuzz1002))
+            object.__setattr__(self, "fuzz1003", components.AffixFuzzer3Batch._required(fuzz1003))
+            object.__setattr__(self, "fuzz1004", components.AffixFuzzer4Batch._required(fuzz1004))
+            object.__setattr__(self, "fuzz1005", components.AffixFuzzer5Batch._required(fuzz1005))
+            object.__setattr__(self, "fuzz1006", components.AffixFuzzer6Batch._required(fuzz1006))
+            object.__setattr__(self, "fuzz1007", components.AffixFuzzer7Batch._required(fuzz1007))
+            object.__setattr__(self, "fuzz1008", components.AffixFuzzer8Batch._required(fuzz1008))
+            object.__setattr__(self, "fuzz1009", components.AffixFuzzer9Batch._required(fuzz1009))
+            object.__setattr__(self, "fuzz1010", components.AffixFuzzer10Batch._required(fuzz1010))
+            object.__setattr__(self, "fuzz1011", components.AffixFuzzer11Batch._required(fuzz1011))
+            object.__setattr__(self, "fuzz1012", components.AffixFuzzer12Batch._required(fuzz1012))
+            object.__setattr__(self, "fuzz1013", components.AffixFuzzer13Batch._required(fuzz1013))
+            object.__setattr__(self, "fuzz1014", components.AffixFuzzer14Batch._required(fuzz1014))
+            object.__setattr__(self, "fuzz1015", components.AffixFuzzer15Batch._required(fuzz1015))
+            object.__setattr__(self, "fuzz1016", components.AffixFuzzer16Batch._required(fuzz1016))
+            object.__setattr__(self, "fuzz1017", components.AffixFuzzer17Batch._required(fuzz1017))
+            object.__setattr__(self, "fuzz1018", components.AffixFuzzer18Batch._required(fuzz1018))
+            object.__setattr__(self, "fuzz1019", components.AffixFuzzer19Batch._required(fuzz1019))
+            object.__setattr__(self, "fuzz1020", components.AffixFuzzer20Batch._required(fuzz1020))
+            object.__setattr__(self, "fuzz1021", components.AffixFuzzer21Batch._required(fuzz1021))
+            object.__setattr__(self, "fuzz1022", components.AffixFuzzer22Batch._required(fuzz1022))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            fuzz1001=None,  # type: ignore[arg-type]
-            fuzz1002=None,  # type: ignore[arg-type]
-            fuzz1003=None,  # type: ignore[arg-type]
-            fuzz1004=None,  # type: ignore[arg-type]
-            fuzz1005=None,  # type: ignore[arg-type]
-            fuzz1006=None,  # type: ignore[arg-type]
-            fuzz1007=None,  # type: ignore[arg-type]
-            fuzz1008=None,  # type: ignore[arg-type]
-            fuzz1009=None,  # type: ignore[arg-type]
-            fuzz1010=None,  # type: ignore[arg-type]
-            fuzz1011=None,  # type: ignore[arg-type]
-            fuzz1012=None,  # type: ignore[arg-type]
-            fuzz1013=None,  # type: ignore[arg-type]
-            fuzz1014=None,  # type: ignore[arg-type]
-            fuzz1015=None,  # type: ignore[arg-type]
-            fuzz1016=None,  # type: ignore[arg-type]
-            fuzz1017=None,  # type: ignore[arg-type]
-            fuzz1018=None,  # type: ignore[arg-type]
-            fuzz1019=None,  # type: ignore[arg-type]
-            fuzz1020=None,  # type: ignore[arg-type]
-            fuzz1021=None,  # type: ignore[arg-type]
-            fuzz1022=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "fuzz1001", components.AffixFuzzer1Batch._required(None))
+        object.__setattr__(self, "fuzz1002", components.AffixFuzzer2Batch._required(None))
+        object.__setattr__(self, "fuzz1003", components.AffixFuzzer3Batch._required(None))
+        object.__setattr__(self, "fuzz1004", components.AffixFuzzer4Batch._required(None))
+        object.__setattr__(self, "fuzz1005", components.AffixFuzzer5Batch._required(None))
+        object.__setattr__(self, "fuzz1006", components.AffixFuzzer6Batch._required(None))
+        object.__setattr__(self, "fuzz1007", components.AffixFuzzer7Batch._required(None))
+        object.__setattr__(self, "fuzz1008", components.AffixFuzzer8Batch._required(None))
+        object.__setattr__(self, "fuzz1009", components.AffixFuzzer9Batch._required(None))
+        object.__setattr__(self, "fuzz1010", components.AffixFuzzer10Batch._required(None))
+        object.__setattr__(self, "fuzz1011", components.AffixFuzzer11Batch._required(None))
+        object.__setattr__(self, "fuzz1012", components.AffixFuzzer12Batch._required(None))
+        object.__setattr__(self, "fuzz1013", components.AffixFuzzer13Batch._required(None))
+        object.__setattr__(self, "fuzz1014", components.AffixFuzzer14Batch._required(None))
+        object.__setattr__(self, "fuzz1015", components.AffixFuzzer15Batch._required(None))
+        object.__setattr__(self, "fuzz1016", components.AffixFuzzer16Batch._required(None))
+        object.__setattr__(self, "fuzz1017", components.AffixFuzzer17Batch._required(None))
+        object.__setattr__(self, "fuzz1018", components.AffixFuzzer18Batch._required(None))
+        object.__setattr__(self, "fuzz1019", components.AffixFuzzer19Batch._required(None))
+        object.__setattr__(self, "fuzz1020", components.AffixFuzzer20Batch._required(None))
+        object.__setattr__(self, "fuzz1021", components.AffixFuzzer21Batch._required(None))
+        object.__setattr__(self, "fuzz1022", components.AffixFuzzer22Batch._required(None))
 
     @classmethod
     def _clear(cls) -> AffixFuzzer1:
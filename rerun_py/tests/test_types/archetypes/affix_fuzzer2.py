@@ -43,54 +43,50 @@ class AffixFuzzer2(Archetype):
         """Create a new instance of the AffixFuzzer2 archetype."""
 
         # You can define your own __init__ function as a member of AffixFuzzer2Ext in affix_fuzzer2_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                fuzz1101=fuzz1101,
-                fuzz1102=fuzz1102,
-                fuzz1103=fuzz1103,
-                fuzz1104=fuzz1104,
-                fuzz1105=fuzz1105,
-                fuzz1106=fuzz1106,
-                fuzz1107=fuzz1107,
-                fuzz1108=fuzz1108,
-                fuzz1109=fuzz1109,
-                fuzz1110=fuzz1110,
-                fuzz1111=fuzz1111,
-                fuzz1112=fuzz1112,
-                fuzz1113=fuzz1113,
-                fuzz1114=fuzz1114,
-                fuzz1115=fuzz1115,
-                fuzz1116=fuzz1116,
-                fuzz1117=fuzz1117,
-                fuzz1118=fuzz1118,
-                fuzz1122=fuzz1122,
-            )
+        with catch_and_log_exceptions(context="AffixFuzzer2"):
+            object.__setattr__(self, "fuzz1101", components.AffixFuzzer1Batch._required(fuzz1101))
+            object.__setattr__(self, "fuzz1102", components.AffixFuzzer2Batch._required(fuzz1102))
+            object.__setattr__(self, "fuzz1103", components.AffixFuzzer3Batch._required(fuzz1103))
+            object.__setattr__(self, "fuzz1104", components.AffixFuzzer4Batch._required(fuzz1104))
+            object.__setattr__(self, "fuzz1105", components.AffixFuzzer5Batch._required(fuzz1105))
+            object.__setattr__(self, "fuzz1106", components.AffixFuzzer6Batch._required(fuzz1106))
+            object.__setattr__(self, "fuzz1107", components.AffixFuzzer7Batch._required(fuzz1107))
+            object.__setattr__(self, "fuzz1108", components.AffixFuzzer8Batch._required(fuzz1108))
+            object.__setattr__(self, "fuzz1109", components.AffixFuzzer9Batch._required(fuzz1109))
+            object.__setattr__(self, "fuzz1110", components.AffixFuzzer10Batch._required(fuzz1110))
+            object.__setattr__(self, "fuzz1111", components.AffixFuzzer11Batch._required(fuzz1111))
+            object.__setattr__(self, "fuzz1112", components.AffixFuzzer12Batch._required(fuzz1112))
+            object.__setattr__(self, "fuzz1113", components.AffixFuzzer13Batch._required(fuzz1113))
+            object.__setattr__(self, "fuzz1114", components.AffixFuzzer14Batch._required(fuzz1114))
+            object.__setattr__(self, "fuzz1115", components.AffixFuzzer15Batch._required(fuzz1115))
+            object.__setattr__(self, "fuzz1116", components.AffixFuzzer16Batch._required(fuzz1116))
+            object.__setattr__(self, "fuzz1117", components.AffixFuzzer17Batch._required(fuzz1117))
+            object.__setattr__(self, "fuzz1118", components.AffixFuzzer18Batch._required(fuzz1118))
+            object.__setattr__(self, "fuzz1122", components.AffixFuzzer22Batch._required(fuzz1122))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            fuzz1101=None,  # type: ignore[arg-type]
-            fuzz1102=None,  # type: ignore[arg-type]
-            fuzz1103=None,  # type: ignore[arg-type]
-            fuzz1104=None,  # type: ignore[arg-type]
-            fuzz1105=None,  # type: ignore[arg-type]
-            fuzz1106=None,  # type: ignore[arg-type]
-            fuzz1107=None,  # type: ignore[arg-type]
-            fuzz1108=None,  # type: ignore[arg-type]
-            fuzz1109=None,  # type: ignore[arg-type]
-            fuzz1110=None,  # type: ignore[arg-type]
-            fuzz1111=None,  # type: ignore[arg-type]
-            fuzz1112=None,  # type: ignore[arg-type]
-            fuzz1113=None,  # type: ignore[arg-type]
-            fuzz1114=None,  # type: ignore[arg-type]
-            fuzz1115=None,  # type: ignore[arg-type]
-            fuzz1116=None,  # type: ignore[arg-type]
-            fuzz1117=None,  # type: ignore[arg-type]
-            fuzz1118=None,  # type: ignore[arg-type]
-            fuzz1122=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "fuzz1101", components.AffixFuzzer1Batch._required(None))
+        object.__setattr__(self, "fuzz1102", components.AffixFuzzer2Batch._required(None))
+        object.__setattr__(self, "fuzz1103", components.AffixFuzzer3Batch._required(None))
+        object.__setattr__(self, "fuzz1104", components.AffixFuzzer4Batch._required(None))
+        object.__setattr__(self, "fuzz1105", components.AffixFuzzer5Batch._required(None))
+        object.__setattr__(self, "fuzz1106", components.AffixFuzzer6Batch._required(None))
+        object.__setattr__(self, "fuzz1107", components.AffixFuzzer7Batch._required(None))
+        object.__setattr__(self, "fuzz1108", components.AffixFuzzer8Batch._required(None))
+        object.__setattr__(self, "fuzz1109", components.AffixFuzzer9Batch._required(None))
+        object.__setattr__(self, "fuzz1110", components.AffixFuzzer10Batch._required(None))
+        object.__setattr__(self, "fuzz1111", components.AffixFuzzer11Batch._required(None))
+        object.__setattr__(self, "fuzz1112", components.AffixFuzzer12Batch._required(None))
+        object.__setattr__(self, "fuzz1113", components.AffixFuzzer13Batch._required(None))
+        object.__setattr__(self, "fuzz1114", components.AffixFuzzer14Batch._required(None))
+        object.__setattr__(self, "fuzz1115", components.AffixFuzzer15Batch._required(None))
+        object.__setattr__(self, "fuzz1116", components.AffixFuzzer16Batch._required(None))
+        object.__setattr__(self, "fuzz1117", components.AffixFuzzer17Batch._required(None))
+        object.__setattr__(self, "fuzz1118", components.AffixFuzzer18Batch._required(None))
+        object.__setattr__(self, "fuzz1122", components.AffixFuzzer22Batch._required(None))
 
     @classmethod
     def _clear(cls) -> AffixFuzzer2:
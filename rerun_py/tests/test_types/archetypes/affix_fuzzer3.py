@@ -43,52 +43,48 @@ class AffixFuzzer3(Archetype):
         """Create a new instance of the AffixFuzzer3 archetype."""
 
         # You can define your own __init__ function as a member of AffixFuzzer3Ext in affix_fuzzer3_ext.py
-        with catch_and_log_exceptions(context=self.__class__.__name__):
-            self.__attrs_init__(
-                fuzz2001=fuzz2001,
-                fuzz2002=fuzz2002,
-                fuzz2003=fuzz2003,
-                fuzz2004=fuzz2004,
-                fuzz2005=fuzz2005,
-                fuzz2006=fuzz2006,
-                fuzz2007=fuzz2007,
-                fuzz2008=fuzz2008,
-                fuzz2009=fuzz2009,
-                fuzz2010=fuzz2010,
-                fuzz2011=fuzz2011,
-                fuzz2012=fuzz2012,
-                fuzz2013=fuzz2013,
-                fuzz2014=fuzz2014,
-                fuzz2015=fuzz2015,
-                fuzz2016=fuzz2016,
-                fuzz2017=fuzz2017,
-                fuzz2018=fuzz2018,
-            )
+        with catch_and_log_exceptions(context="AffixFuzzer3"):
+            object.__setattr__(self, "fuzz2001", components.AffixFuzzer1Batch._optional(fuzz2001))
+            object.__setattr__(self, "fuzz2002", components.AffixFuzzer2Batch._optional(fuzz2002))
+            object.__setattr__(self, "fuzz2003", components.AffixFuzzer3Batch._optional(fuzz2003))
+            object.__setattr__(self, "fuzz2004", components.AffixFuzzer4Batch._optional(fuzz2004))
+            object.__setattr__(self, "fuzz2005", components.AffixFuzzer5Batch._optional(fuzz2005))
+            object.__setattr__(self, "fuzz2006", components.AffixFuzzer6Batch._optional(fuzz2006))
+            object.__setattr__(self, "fuzz2007", components.AffixFuzzer7Batch._optional(fuzz2007))
+            object.__setattr__(self, "fuzz2008", components.AffixFuzzer8Batch._optional(fuzz2008))
+            object.__setattr__(self, "fuzz2009", components.AffixFuzzer9Batch._optional(fuzz2009))
+            object.__setattr__(self, "fuzz2010", components.AffixFuzzer10Batch._optional(fuzz2010))
+            object.__setattr__(self, "fuzz2011", components.AffixFuzzer11Batch._optional(fuzz2011))
+            object.__setattr__(self, "fuzz2012", components.AffixFuzzer12Batch._optional(fuzz2012))
+            object.__setattr__(self, "fuzz2013", components.AffixFuzzer13Batch._optional(fuzz2013))
+            object.__setattr__(self, "fuzz2014", components.AffixFuzzer14Batch._optional(fuzz2014))
+            object.__setattr__(self, "fuzz2015", components.AffixFuzzer15Batch._optional(fuzz2015))
+            object.__setattr__(self, "fuzz2016", components.AffixFuzzer16Batch._optional(fuzz2016))
+            object.__setattr__(self, "fuzz2017", components.AffixFuzzer17Batch._optional(fuzz2017))
+            object.__setattr__(self, "fuzz2018", components.AffixFuzzer18Batch._optional(fuzz2018))
             return
         self.__attrs_clear__()
 
     def __attrs_clear__(self) -> None:
-        """Convenience method for calling `__attrs_init__` with all `None`s."""
-        self.__attrs_init__(
-            fuzz2001=None,  # type: ignore[arg-type]
-            fuzz2002=None,  # type: ignore[arg-type]
-            fuzz2003=None,  # type: ignore[arg-type]
-            fuzz2004=None,  # type: ignore[arg-type]
-            fuzz2005=None,  # type: ignore[arg-type]
-            fuzz2006=None,  # type: ignore[arg-type]
-            fuzz2007=None,  # type: ignore[arg-type]
-            fuzz2008=None,  # type: ignore[arg-type]
-            fuzz2009=None,  # type: ignore[arg-type]
-            fuzz2010=None,  # type: ignore[arg-type]
-            fuzz2011=None,  # type: ignore[arg-type]
-            fuzz2012=None,  # type: ignore[arg-type]
-            fuzz2013=None,  # type: ignore[arg-type]
-            fuzz2014=None,  # type: ignore[arg-type]
-            fuzz2015=None,  # type: ignore[arg-type]
-            fuzz2016=None,  # type: ignore[arg-type]
-            fuzz2017=None,  # type: ignore[arg-type]
-            fuzz2018=None,  # type: ignore[arg-type]
-        )
+        """Convenience method for clearing all fields, bypassing `__attrs_init__`."""
+        object.__setattr__(self, "fuzz2001", None)
+        object.__setattr__(self, "fuzz2002", None)
+        object.__setattr__(self, "fuzz2003", None)
+        object.__setattr__(self, "fuzz2004", None)
+        object.__setattr__(self, "fuzz2005", None)
+        object.__setattr__(self, "fuzz2006", None)
+        object.__setattr__(self, "fuzz2007", None)
+        object.__setattr__(self, "fuzz2008", None)
+        object.__setattr__(self, "fuzz2009", None)
+        object.__setattr__(self, "fuzz2010", None)
+        object.__setattr__(self, "fuzz2011", None)
+        object.__setattr__(self, "fuzz2012", None)
+        object.__setattr__(self, "fuzz2013", None)
+        object.__setattr__(self, "fuzz2014", None)
+        object.__setattr__(self, "fuzz2015", None)
+        object.__setattr__(self, "fuzz2016", None)
+        object.__setattr__(self, "fuzz2017", None)
+        object.__setattr__(self, "fuzz2018", None)
 
     @classmethod
     def _clear(cls) -> AffixFuzzer3:
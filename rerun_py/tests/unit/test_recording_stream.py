@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Generator, Iterator
+
+import pytest
+import rerun as rr
+import rerun_bindings as bindings
+from rerun import recording_stream
+
+
+@pytest.fixture
+def no_active_recording() -> Iterator[None]:
+    """Run the test without any active recording, restoring the previously active ones afterwards."""
+    prev_any_recording_set = recording_stream._any_recording_set
+    prev_global = bindings.set_global_data_recording(recording=None)
+    prev_thread_local = bindings.set_thread_local_data_recording(recording=None)
+    recording_stream._any_recording_set = False
+
+    yield
+
+    bindings.set_global_data_recording(recording=prev_global)
+    bindings.set_thread_local_data_recording(recording=prev_thread_local)
+    # Only claim that no recording was ever set if that is still true once they are restored.
+    recording_stream._any_recording_set = (
+        prev_any_recording_set or prev_global is not None or prev_thread_local is not None
+    )
+
+
+def test_get_data_recording_explicit(no_active_recording: None) -> None:
+    """An explicitly passed recording is returned as-is, without looking at the active ones."""
+    rec = rr.new_recording("rerun_example_test_recording_stream")
+    assert rr.get_data_recording(rec) is rec
+
+
+def test_get_data_recording_none_set(no_active_recording: None) -> None:
+    assert rr.get_data_recording() is None
+
+
+def test_get_data_recording_after_init(no_active_recording: None) -> None:
+    rr.init("rerun_example_test_recording_stream", recording_id="test_init")
+    assert recording_stream._any_recording_set
+    assert rr.get_recording_id(rr.get_data_recording()) == "test_init"
+
+
+def test_get_data_recording_after_set_global(no_active_recording: None) -> None:
+    rec = rr.new_recording("rerun_example_test_recording_stream", recording_id="test_global")
+    rr.set_global_data_recording(rec)
+    assert recording_stream._any_recording_set
+    assert rr.get_recording_id(rr.get_data_recording()) == "test_global"
+
+
+def test_get_data_recording_after_set_thread_local(no_active_recording: None) -> None:
+    rec = rr.new_recording("rerun_example_test_recording_stream", recording_id="test_thread_local")
+    rr.set_thread_local_data_recording(rec)
+    assert recording_stream._any_recording_set
+    assert rr.get_recording_id(rr.get_data_recording()) == "test_thread_local"
+
+
+def test_get_data_recording_within_context(no_active_recording: None) -> None:
+    rec = rr.new_recording("rerun_example_test_recording_stream", recording_id="test_context")
+    with rec:
+        assert recording_stream._any_recording_set
+        assert rr.get_recording_id(rr.get_data_recording()) == "test_context"
+
+
+def test_thread_local_stream_generator() -> None:
+    """A decorated generator behaves like the original one: `send`, `throw` and return values go through."""
+    received: list[int] = []
+
+    @rr.thread_local_stream("rerun_example_test_recording_stream")
+    def gen() -> Generator[str, int, str]:
+        try:
+            while True:
+                received.append((yield "ready"))
+        except ValueError:
+            return "done"
+
+    it = gen()
+    assert next(it) == "ready"
+    assert it.send(1) == "ready"
+    assert it.send(2) == "ready"
+    assert received == [1, 2]
+
+    with pytest.raises(StopIteration) as excinfo:
+        it.throw(ValueError("stop"))
+    assert excinfo.value.value == "done"
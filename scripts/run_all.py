@@ -58,7 +58,7 @@ MAC_SKIP_LIST = [
 ]
 
 
-def start_process(args: list[str], *, wait: bool) -> Any:
+def start_process(args: list[str], *, wait: bool, env: dict[str, str] | None = None) -> Any:
     readable_cmd = " ".join(f'"{a}"' if " " in a else a for a in args)
     print(f"> {readable_cmd}")
 
@@ -66,6 +66,7 @@ def start_process(args: list[str], *, wait: bool) -> Any:
         args,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
+        env=env,
     )
     if wait:
         returncode = process.wait()
@@ -88,9 +89,14 @@ def run_py_example(path: str, viewer_port: int | None = None, *, wait: bool = Tr
     if viewer_port is not None:
         args += ["--connect", f"--addr=127.0.0.1:{viewer_port}"]
 
+    # Let the SDK know it is being run as one of our official examples.
+    env = os.environ.copy()
+    env["RERUN_DETECT_EXAMPLE_PATH"] = "1"
+
     return start_process(
         args,
         wait=wait,
+        env=env,
     )
 
 
@@ -80,6 +80,7 @@ def run_example(example: str, extra_args: list[str]) -> None:
     env = os.environ.copy()
     env["RERUN_STRICT"] = "1"
     env["RERUN_PANIC_ON_WARN"] = "1"
+    env["RERUN_DETECT_EXAMPLE_PATH"] = "1"
 
     cmd = ["python", "-m", "rerun", "--port", str(PORT), "--test-receive"]
     rerun_process = subprocess.Popen(cmd, env=env)